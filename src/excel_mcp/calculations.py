@@ -56,5 +56,5 @@ def apply_formula(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to apply formula: {e}")
+        logger.error("Failed to apply formula: %s", e)
         raise CalculationError(str(e))
\ No newline at end of file
@@ -1,6 +1,10 @@
 import re
 
 from openpyxl.utils import column_index_from_string
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+_CELL_REF_RE = re.compile(r"([A-Z]+)([0-9]+)")
 
 def parse_cell_range(
     cell_ref: str,
@@ -14,7 +18,7 @@ def parse_cell_range(
         start_cell = cell_ref
         end_cell = None
 
-    match = re.match(r"([A-Z]+)([0-9]+)", start_cell.upper())
+    match = _CELL_REF_RE.match(start_cell.upper())
     if not match:
         raise ValueError(f"Invalid cell reference: {start_cell}")
     col_str, row_str = match.groups()
@@ -22,7 +26,7 @@ def parse_cell_range(
     start_col = column_index_from_string(col_str)
 
     if end_cell:
-        match = re.match(r"([A-Z]+)([0-9]+)", end_cell.upper())
+        match = _CELL_REF_RE.match(end_cell.upper())
         if not match:
             raise ValueError(f"Invalid cell reference: {end_cell}")
         col_str, row_str = match.groups()
@@ -51,4 +55,30 @@ def validate_cell_reference(cell_ref: str) -> bool:
         else:
             return False
 
-    return bool(col and row) 
\ No newline at end of file
+    return bool(col and row) 
+
+def get_sheet_bounds(worksheet) -> tuple[int, int, int, int]:
+    """Get (min_row, min_col, max_row, max_col) of the cells stored in a worksheet.
+
+    Read-only worksheets trust the file's dimension record, which may be missing
+    or stale, so their bounds are computed by streaming the rows instead. An
+    empty sheet is reported as 1x1, as in normal mode.
+    """
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        return worksheet.min_row, worksheet.min_column, worksheet.max_row, worksheet.max_column
+
+    worksheet.reset_dimensions()
+    min_row = min_col = max_row = max_col = None
+    for row in worksheet.iter_rows():
+        stored = [cell for cell in row if cell is not EMPTY_CELL]
+        if not stored:
+            continue
+        if min_row is None:
+            min_row = stored[0].row
+        max_row = stored[0].row
+        min_col = stored[0].column if min_col is None else min(min_col, stored[0].column)
+        max_col = stored[-1].column if max_col is None else max(max_col, stored[-1].column)
+
+    if min_row is None:
+        return 1, 1, 1, 1
+    return min_row, min_col, max_row, max_col
\ No newline at end of file
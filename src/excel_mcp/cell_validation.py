@@ -1,7 +1,8 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
 
 logger = logging.getLogger(__name__)
@@ -30,9 +31,53 @@ def get_data_validation_for_cell(worksheet: Worksheet, cell_address: str) -> Opt
         return None
         
     except Exception as e:
-        logger.warning(f"Failed to get validation for cell {cell_address}: {e}")
+        logger.warning("Failed to get validation for cell %s: %s", cell_address, e)
         return None
 
+def get_data_validations_for_range(
+    worksheet: Worksheet,
+    min_row: int,
+    min_col: int,
+    max_row: int,
+    max_col: int
+) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """Map each validated cell in a rectangular range to its validation metadata.
+    
+    Each validation rule is intersected with the range once, so callers can look
+    cells up by (row, column) instead of scanning every rule for every cell. As
+    with get_data_validation_for_cell, the first matching rule wins. The metadata
+    dict is shared by all cells of a rule; its "cell" entry is only a placeholder
+    (the top-left cell of the rule's first range overlapping the requested range)
+    and callers should set it to the actual cell address.
+    
+    Returns:
+        Dictionary keyed by (row, column) for cells that have validation
+    """
+    validations: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    
+    for dv in worksheet.data_validations.dataValidation:
+        try:
+            validation_info = None
+            for cell_range in dv.sqref.ranges:
+                row_lo = max(cell_range.min_row, min_row)
+                row_hi = min(cell_range.max_row, max_row)
+                col_lo = max(cell_range.min_col, min_col)
+                col_hi = min(cell_range.max_col, max_col)
+                if row_lo > row_hi or col_lo > col_hi:
+                    continue
+                    
+                if validation_info is None:
+                    validation_info = _extract_validation_metadata(
+                        dv, f"{get_column_letter(col_lo)}{row_lo}", worksheet
+                    )
+                for row in range(row_lo, row_hi + 1):
+                    for col in range(col_lo, col_hi + 1):
+                        validations.setdefault((row, col), validation_info)
+        except Exception as e:
+            logger.warning("Failed to map validation range for DV sqref '%s': %s", getattr(dv, 'sqref', 'N/A'), e)
+            
+    return validations
+
 def _cell_in_validation_range(row: int, col: int, data_validation) -> bool:
     """Check if a cell is within a data validation range."""
     try:
@@ -43,7 +88,7 @@ def _cell_in_validation_range(row: int, col: int, data_validation) -> bool:
                 return True
         return False
     except Exception as e:
-        logger.warning(f"Error checking if cell ({row}, {col}) is in validation range for DV sqref '{getattr(data_validation, 'sqref', 'N/A')}': {e}")
+        logger.warning("Error checking if cell (%s, %s) is in validation range for DV sqref '%s': %s", row, col, getattr(data_validation, 'sqref', 'N/A'), e)
         return False
 
 def _extract_validation_metadata(data_validation, cell_address: str, worksheet: Optional[Worksheet] = None) -> Dict[str, Any]:
@@ -84,7 +129,7 @@ def _extract_validation_metadata(data_validation, cell_address: str, worksheet:
         return validation_info
         
     except Exception as e:
-        logger.warning(f"Failed to extract validation metadata: {e}")
+        logger.warning("Failed to extract validation metadata: %s", e)
         return {
             "cell": cell_address,
             "has_validation": True,
@@ -137,7 +182,7 @@ def _extract_list_values(formula: str, worksheet: Optional[Worksheet] = None) ->
                 return [f"Range: {formula} (empty or unresolvable)"]
                 
             except Exception as e:
-                logger.warning(f"Could not resolve range '{formula}' for list validation: {e}")
+                logger.warning("Could not resolve range '%s' for list validation: %s", formula, e)
                 return [f"Range: {formula} (resolution error)"]
                 
         # Handle range reference when worksheet not available
@@ -149,7 +194,7 @@ def _extract_list_values(formula: str, worksheet: Optional[Worksheet] = None) ->
             return [formula.strip('"')]
             
     except Exception as e:
-        logger.warning(f"Failed to parse list formula '{formula}': {e}")
+        logger.warning("Failed to parse list formula '%s': %s", formula, e)
         return [formula]  # Return original formula if parsing fails
 
 def get_all_validation_ranges(worksheet: Worksheet) -> List[Dict[str, Any]]:
@@ -174,6 +219,6 @@ def get_all_validation_ranges(worksheet: Worksheet) -> List[Dict[str, Any]]:
             validations.append(validation_info)
             
     except Exception as e:
-        logger.warning(f"Failed to get validation ranges: {e}")
+        logger.warning("Failed to get validation ranges: %s", e)
         
     return validations 
\ No newline at end of file
@@ -75,7 +75,7 @@ def create_chart_in_sheet(
     try:
         wb = load_workbook(filepath)
         if sheet_name not in wb.sheetnames:
-            logger.error(f"Sheet '{sheet_name}' not found")
+            logger.error("Sheet '%s' not found", sheet_name)
             raise ValidationError(f"Sheet '{sheet_name}' not found")
 
         worksheet = wb[sheet_name]
@@ -90,7 +90,7 @@ def create_chart_in_sheet(
         if "!" in data_range:
             range_sheet_name, cell_range = data_range.split("!")
             if range_sheet_name not in wb.sheetnames:
-                logger.error(f"Sheet '{range_sheet_name}' referenced in data range not found")
+                logger.error("Sheet '%s' referenced in data range not found", range_sheet_name)
                 raise ValidationError(f"Sheet '{range_sheet_name}' referenced in data range not found")
         else:
             cell_range = data_range
@@ -99,7 +99,7 @@ def create_chart_in_sheet(
             start_cell, end_cell = cell_range.split(":")
             start_row, start_col, end_row, end_col = parse_cell_range(start_cell, end_cell)
         except ValueError as e:
-            logger.error(f"Invalid data range format: {e}")
+            logger.error("Invalid data range format: %s", e)
             raise ValidationError(f"Invalid data range format: {str(e)}")
 
         # Validate chart type
@@ -114,7 +114,7 @@ def create_chart_in_sheet(
         chart_type_lower = chart_type.lower()
         ChartClass = chart_classes.get(chart_type_lower)
         if not ChartClass:
-            logger.error(f"Unsupported chart type: {chart_type}")
+            logger.error("Unsupported chart type: %s", chart_type)
             raise ValidationError(
                 f"Unsupported chart type: {chart_type}. "
                 f"Supported types: {', '.join(chart_classes.keys())}"
@@ -166,7 +166,7 @@ def create_chart_in_sheet(
                 chart.add_data(data, titles_from_data=True)
                 chart.set_categories(cats)
         except Exception as e:
-            logger.error(f"Failed to create chart data references: {e}")
+            logger.error("Failed to create chart data references: %s", e)
             raise ChartError(f"Failed to create chart data references: {str(e)}")
 
         # Apply style if provided
@@ -202,7 +202,7 @@ def create_chart_in_sheet(
                 if hasattr(chart, "y_axis"):
                     chart.y_axis.majorGridlines = ChartLines()
         except Exception as e:
-            logger.error(f"Failed to apply chart style: {e}")
+            logger.error("Failed to apply chart style: %s", e)
             raise ChartError(f"Failed to apply chart style: {str(e)}")
 
         # Set chart size
@@ -229,16 +229,16 @@ def create_chart_in_sheet(
             worksheet._drawings.append(drawing)
             worksheet._charts.append(chart)
         except ValueError as e:
-            logger.error(f"Invalid target cell: {e}")
+            logger.error("Invalid target cell: %s", e)
             raise ValidationError(f"Invalid target cell: {str(e)}")
         except Exception as e:
-            logger.error(f"Failed to create chart drawing: {e}")
+            logger.error("Failed to create chart drawing: %s", e)
             raise ChartError(f"Failed to create chart drawing: {str(e)}")
 
         try:
             wb.save(filepath)
         except Exception as e:
-            logger.error(f"Failed to save workbook: {e}")
+            logger.error("Failed to save workbook: %s", e)
             raise ChartError(f"Failed to save workbook with chart: {str(e)}")
 
         return {
@@ -253,5 +253,5 @@ def create_chart_in_sheet(
     except (ValidationError, ChartError):
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating chart: {e}")
+        logger.error("Unexpected error creating chart: %s", e)
         raise ChartError(f"Unexpected error creating chart: {str(e)}")
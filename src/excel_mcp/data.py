@@ -1,17 +1,22 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import logging
 
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from openpyxl.utils.exceptions import CellCoordinatesException
 
 from .exceptions import DataError
-from .cell_utils import parse_cell_range
-from .cell_validation import get_data_validation_for_cell
+from .cell_utils import parse_cell_range, get_sheet_bounds
+from .cell_validation import get_data_validations_for_range
 
 logger = logging.getLogger(__name__)
 
+# Number of rows read from the start of the range when preview_only is set
+PREVIEW_ROWS = 10
+
 def read_excel_range(
     filepath: Path | str,
     sheet_name: str,
@@ -20,13 +25,31 @@ def read_excel_range(
     preview_only: bool = False
 ) -> List[Dict[str, Any]]:
     """Read data from Excel range with optional preview mode"""
+    return list(iter_excel_range(filepath, sheet_name, start_cell, end_cell, preview_only))
+
+def iter_excel_range(
+    filepath: Path | str,
+    sheet_name: str,
+    start_cell: str = "A1",
+    end_cell: Optional[str] = None,
+    preview_only: bool = False
+) -> Iterator[List[Any]]:
+    """Lazily yield non-empty rows of an Excel range.
+    
+    The workbook stays open until the iterator is exhausted or closed.
+    """
+    wb = None
     try:
-        wb = load_workbook(filepath, read_only=False)
+        # Only cell values are needed, so stream the sheet instead of
+        # building the full styled cell model
+        wb = load_workbook(filepath, read_only=True)
         
         if sheet_name not in wb.sheetnames:
             raise DataError(f"Sheet '{sheet_name}' not found")
             
         ws = wb[sheet_name]
+        # Read-only sheets may carry a stale dimension record
+        sheet_min_row, sheet_min_col, sheet_max_row, sheet_max_col = get_sheet_bounds(ws)
 
         # Parse start cell
         if ':' in start_cell:
@@ -34,60 +57,64 @@ def read_excel_range(
             
         # Get start coordinates
         try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(coord is not None for coord in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
-        except ValueError as e:
+            col_letter, start_row = coordinate_from_string(start_cell)
+            start_col = column_index_from_string(col_letter)
+        except (CellCoordinatesException, ValueError) as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
         # Determine end coordinates
         if end_cell:
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(coord is not None for coord in end_coords[:2]):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
-            except ValueError as e:
+                col_letter, end_row = coordinate_from_string(end_cell)
+                end_col = column_index_from_string(col_letter)
+            except (CellCoordinatesException, ValueError) as e:
                 raise DataError(f"Invalid end cell format: {str(e)}")
         else:
             # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+            if sheet_max_row == 1 and sheet_max_col == 1 and ws.cell(1, 1).value is None:
                 # Handle empty sheet
                 end_row, end_col = start_row, start_col
             else:
                 # Use the sheet's own boundaries
-                start_row, start_col = ws.min_row, ws.min_column
-                end_row, end_col = ws.max_row, ws.max_column
+                start_row, start_col = sheet_min_row, sheet_min_col
+                end_row, end_col = sheet_max_row, sheet_max_col
 
         # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
+        if start_row > sheet_max_row or start_col > sheet_max_col:
             # This case can happen if start_cell is outside the used area on a sheet with data
             # or on a completely empty sheet.
             logger.warning(
-                f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
-                f"No data will be read."
+                "Start cell %s is outside the sheet's data boundary "
+                "(%s%s:%s%s). "
+                "No data will be read.",
+                start_cell,
+                get_column_letter(sheet_min_col), sheet_min_row,
+                get_column_letter(sheet_max_col), sheet_max_row
             )
-            return []
+            return
 
-        data = []
-        for row in range(start_row, end_row + 1):
-            row_data = []
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                row_data.append(cell.value)
-            if any(v is not None for v in row_data):
-                data.append(row_data)
+        if preview_only:
+            end_row = min(end_row, start_row + PREVIEW_ROWS - 1)
 
-        wb.close()
-        return data
+        for row_data in ws.iter_rows(
+            min_row=start_row,
+            max_row=end_row,
+            min_col=start_col,
+            max_col=end_col,
+            values_only=True
+        ):
+            # Skip rows that are entirely empty
+            if row_data.count(None) != len(row_data):
+                yield list(row_data)
     except DataError as e:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to read Excel range: {e}")
+        logger.error("Failed to read Excel range: %s", e)
         raise DataError(str(e))
+    finally:
+        if wb is not None:
+            wb.close()
 
 def write_data(
     filepath: str,
@@ -99,6 +126,7 @@ def write_data(
     
     Headers are handled intelligently based on context.
     """
+    wb = None
     try:
         if not data:
             raise DataError("No data provided to write")
@@ -128,15 +156,17 @@ def write_data(
             _write_data_to_worksheet(ws, data, start_cell)
 
         wb.save(filepath)
-        wb.close()
 
         return {"message": f"Data written to {sheet_name}", "active_sheet": sheet_name}
     except DataError as e:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to write data: {e}")
+        logger.error("Failed to write data: %s", e)
         raise DataError(str(e))
+    finally:
+        if wb is not None:
+            wb.close()
 
 def _write_data_to_worksheet(
     worksheet: Worksheet, 
@@ -164,7 +194,7 @@ def _write_data_to_worksheet(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to write worksheet data: {e}")
+        logger.error("Failed to write worksheet data: %s", e)
         raise DataError(str(e))
 
 def read_excel_range_with_metadata(
@@ -172,7 +202,8 @@ def read_excel_range_with_metadata(
     sheet_name: str,
     start_cell: str = "A1",
     end_cell: Optional[str] = None,
-    include_validation: bool = True
+    include_validation: bool = True,
+    preview_only: bool = False
 ) -> Dict[str, Any]:
     """Read data from Excel range with cell metadata including validation rules.
     
@@ -182,17 +213,23 @@ def read_excel_range_with_metadata(
         start_cell: Starting cell address
         end_cell: Ending cell address (optional)
         include_validation: Whether to include validation metadata
+        preview_only: Whether to read only the first PREVIEW_ROWS rows
         
     Returns:
         Dictionary containing structured cell data with metadata
     """
+    wb = None
     try:
-        wb = load_workbook(filepath, read_only=False)
+        # Data validations are only parsed in normal mode; without them
+        # the sheet can be streamed read-only
+        wb = load_workbook(filepath, read_only=not include_validation)
         
         if sheet_name not in wb.sheetnames:
             raise DataError(f"Sheet '{sheet_name}' not found")
             
         ws = wb[sheet_name]
+        # Read-only sheets may carry a stale dimension record
+        sheet_min_row, sheet_min_col, sheet_max_row, sheet_max_col = get_sheet_bounds(ws)
 
         # Parse start cell
         if ':' in start_cell:
@@ -200,45 +237,47 @@ def read_excel_range_with_metadata(
             
         # Get start coordinates
         try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(coord is not None for coord in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
-        except ValueError as e:
+            col_letter, start_row = coordinate_from_string(start_cell)
+            start_col = column_index_from_string(col_letter)
+        except (CellCoordinatesException, ValueError) as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
         # Determine end coordinates
         if end_cell:
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(coord is not None for coord in end_coords[:2]):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
-            except ValueError as e:
+                col_letter, end_row = coordinate_from_string(end_cell)
+                end_col = column_index_from_string(col_letter)
+            except (CellCoordinatesException, ValueError) as e:
                 raise DataError(f"Invalid end cell format: {str(e)}")
         else:
             # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+            if sheet_max_row == 1 and sheet_max_col == 1 and ws.cell(1, 1).value is None:
                 # Handle empty sheet
                 end_row, end_col = start_row, start_col
             else:
                 # Use the sheet's own boundaries, but respect the provided start_cell
-                end_row, end_col = ws.max_row, ws.max_column
+                end_row, end_col = sheet_max_row, sheet_max_col
                 # If start_cell is 'A1' (default), we should find the true start
                 if start_cell == 'A1':
-                    start_row, start_col = ws.min_row, ws.min_column
+                    start_row, start_col = sheet_min_row, sheet_min_col
 
         # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
+        if start_row > sheet_max_row or start_col > sheet_max_col:
             # This case can happen if start_cell is outside the used area on a sheet with data
             # or on a completely empty sheet.
             logger.warning(
-                f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
-                f"No data will be read."
+                "Start cell %s is outside the sheet's data boundary "
+                "(%s%s:%s%s). "
+                "No data will be read.",
+                start_cell,
+                get_column_letter(sheet_min_col), sheet_min_row,
+                get_column_letter(sheet_max_col), sheet_max_row
             )
             return {"range": f"{start_cell}:", "sheet_name": sheet_name, "cells": []}
 
+        if preview_only:
+            end_row = min(end_row, start_row + PREVIEW_ROWS - 1)
+
         # Build structured cell data
         range_str = f"{get_column_letter(start_col)}{start_row}:{get_column_letter(end_col)}{end_row}"
         range_data = {
@@ -247,34 +286,55 @@ def read_excel_range_with_metadata(
             "cells": []
         }
         
+        col_letters = [get_column_letter(col) for col in range(start_col, end_col + 1)]
+        rows = ws.iter_rows(
+            min_row=start_row,
+            max_row=end_row,
+            min_col=start_col,
+            max_col=end_col,
+            values_only=True
+        )
+        # Read-only sheets stop yielding at the last stored row
+        empty_row = (None,) * len(col_letters)
+        cells = range_data["cells"]
+
+        # Resolve validation rules for the whole range up front
+        validations = {}
+        if include_validation:
+            validations = get_data_validations_for_range(
+                ws, start_row, start_col, end_row, end_col
+            )
+
         for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                cell_address = f"{get_column_letter(col)}{row}"
+            row_values = next(rows, empty_row)
+            for col, value in enumerate(row_values, start=start_col):
+                cell_address = f"{col_letters[col - start_col]}{row}"
                 
                 cell_data = {
                     "address": cell_address,
-                    "value": cell.value,
+                    "value": value,
                     "row": row,
                     "column": col
                 }
                 
                 # Add validation metadata if requested
                 if include_validation:
-                    validation_info = get_data_validation_for_cell(ws, cell_address)
+                    validation_info = validations.get((row, col))
                     if validation_info:
-                        cell_data["validation"] = validation_info
+                        cell_data["validation"] = {**validation_info, "cell": cell_address}
                     else:
                         cell_data["validation"] = {"has_validation": False}
                 
-                range_data["cells"].append(cell_data)
+                cells.append(cell_data)
 
-        wb.close()
         return range_data
         
     except DataError as e:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to read Excel range with metadata: {e}")
+        logger.error("Failed to read Excel range with metadata: %s", e)
         raise DataError(str(e))
+    finally:
+        if wb is not None:
+            wb.close()
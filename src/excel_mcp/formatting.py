@@ -245,5 +245,5 @@ def format_range(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to apply formatting: {e}")
+        logger.error("Failed to apply formatting: %s", e)
         raise FormattingError(str(e))
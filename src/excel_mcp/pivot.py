@@ -214,7 +214,7 @@ def create_pivot_table(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to create pivot table: {e}")
+        logger.error("Failed to create pivot table: %s", e)
         raise PivotError(str(e))
 
 
@@ -1,8 +1,16 @@
+import atexit
+import functools
+import json
 import logging
 import os
-from typing import Any, List, Dict, Optional
+import queue
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
+from openpyxl import load_workbook
 
 # Import exceptions
 from excel_mcp.exceptions import (
@@ -21,9 +29,16 @@ from excel_mcp.validation import (
     validate_formula_in_cell_operation as validate_formula_impl,
     validate_range_in_sheet_operation as validate_range_impl
 )
+from excel_mcp.calculations import apply_formula as apply_formula_impl
+from excel_mcp.cell_validation import get_all_validation_ranges
 from excel_mcp.chart import create_chart_in_sheet as create_chart_impl
-from excel_mcp.workbook import get_workbook_info
-from excel_mcp.data import write_data
+from excel_mcp.formatting import format_range as format_range_func
+from excel_mcp.workbook import (
+    create_workbook as create_workbook_impl,
+    create_sheet as create_worksheet_impl,
+    get_workbook_info
+)
+from excel_mcp.data import write_data, read_excel_range_with_metadata
 from excel_mcp.pivot import create_pivot_table as create_pivot_table_impl
 from excel_mcp.tables import create_excel_table as create_table_impl
 from excel_mcp.sheet import (
@@ -37,6 +52,8 @@ from excel_mcp.sheet import (
     insert_cols,
     delete_rows,
     delete_cols,
+    copy_range_operation,
+    delete_range_operation,
 )
 
 # Get project root directory path for log file path.
@@ -44,24 +61,37 @@ from excel_mcp.sheet import (
 # relative paths may cause log files to fail to create
 # due to the client's running location and permission issues,
 # resulting in the program not being able to run.
-# Thus using os.path.join(ROOT_DIR, "excel-mcp.log") instead.
+# Thus using Path(ROOT_DIR) / "excel-mcp.log" instead.
 
-ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-LOG_FILE = os.path.join(ROOT_DIR, "excel-mcp.log")
+ROOT_DIR = str(Path(__file__).resolve().parents[2])
+LOG_FILE = str(Path(ROOT_DIR) / "excel-mcp.log")
 
 # Initialize EXCEL_FILES_PATH variable without assigning a value
 EXCEL_FILES_PATH = None
 
+# Serialized workbook metadata keyed by (path, mtime_ns, size, include_ranges)
+WORKBOOK_METADATA_CACHE_SIZE = 64
+_workbook_metadata_cache: "OrderedDict[Tuple[str, int, int, bool], str]" = OrderedDict()
+
 # Configure logging
+# Records are queued and written to the log file by a background thread,
+# so tool calls don't block on disk IO
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue,
+    # Referring to https://github.com/modelcontextprotocol/python-sdk/issues/409#issuecomment-2816831318
+    # The stdio mode server MUST NOT write anything to its stdout that is not a valid MCP message.
+    logging.FileHandler(LOG_FILE),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        # Referring to https://github.com/modelcontextprotocol/python-sdk/issues/409#issuecomment-2816831318
-        # The stdio mode server MUST NOT write anything to its stdout that is not a valid MCP message.
-        logging.FileHandler(LOG_FILE)
-    ],
+    handlers=[QueueHandler(log_queue)],
 )
+log_listener.start()
+# Flush queued records to the log file at interpreter exit
+atexit.register(log_listener.stop)
 logger = logging.getLogger("excel-mcp")
 # Initialize FastMCP server
 mcp = FastMCP(
@@ -71,6 +101,7 @@ mcp = FastMCP(
     instructions="Excel MCP Server for manipulating Excel files"
 )
 
+@functools.lru_cache(maxsize=256)
 def get_excel_path(filename: str) -> str:
     """Get full path to Excel file.
     
@@ -92,7 +123,66 @@ def get_excel_path(filename: str) -> str:
     # In SSE mode, if it's a relative path, resolve it based on EXCEL_FILES_PATH
     return os.path.join(EXCEL_FILES_PATH, filename)
 
+def _get_cached_workbook_metadata(full_path: str, include_ranges: bool) -> str:
+    """Get serialized workbook metadata, reusing it while the file is unchanged.
+    
+    Args:
+        full_path: Full path to Excel file
+        include_ranges: Whether to include used ranges
+        
+    Returns:
+        Serialized workbook metadata
+    """
+    try:
+        stat = os.stat(full_path)
+        key = (full_path, stat.st_mtime_ns, stat.st_size, include_ranges)
+    except OSError:
+        # Let get_workbook_info report the missing or unreadable file
+        key = None
+
+    if key is not None and key in _workbook_metadata_cache:
+        _workbook_metadata_cache.move_to_end(key)
+        return _workbook_metadata_cache[key]
+
+    result = json.dumps(
+        get_workbook_info(full_path, include_ranges=include_ranges),
+        default=str,
+        separators=(",", ":")
+    )
+    if key is not None:
+        _workbook_metadata_cache[key] = result
+        if len(_workbook_metadata_cache) > WORKBOOK_METADATA_CACHE_SIZE:
+            _workbook_metadata_cache.popitem(last=False)
+    return result
+
+def excel_tool(*expected_errors: type[Exception]) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Wrap a tool with shared path resolution and error handling.
+    
+    The wrapped function receives the resolved full path as its ``filepath``
+    argument while keeping its signature for FastMCP.
+    
+    Args:
+        expected_errors: Exception types reported back as "Error: ..." strings;
+            anything else is logged and re-raised
+        
+    Returns:
+        Decorator producing the tool function
+    """
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(func)
+        def wrapper(filepath: str, *args: Any, **kwargs: Any) -> str:
+            try:
+                return func(get_excel_path(filepath), *args, **kwargs)
+            except expected_errors as e:
+                return f"Error: {str(e)}"
+            except Exception as e:
+                logger.error("Error in %s: %s", func.__name__, e)
+                raise
+        return wrapper
+    return decorator
+
 @mcp.tool()
+@excel_tool(ValidationError, CalculationError)
 def apply_formula(
     filepath: str,
     sheet_name: str,
@@ -103,24 +193,17 @@ def apply_formula(
     Apply Excel formula to cell.
     Excel formula will write to cell with verification.
     """
-    try:
-        full_path = get_excel_path(filepath)
-        # First validate the formula
-        validation = validate_formula_impl(full_path, sheet_name, cell, formula)
-        if isinstance(validation, dict) and "error" in validation:
-            return f"Error: {validation['error']}"
-            
-        # If valid, apply the formula
-        from excel_mcp.calculations import apply_formula as apply_formula_impl
-        result = apply_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error applying formula: {e}")
-        raise
+    # First validate the formula
+    validation = validate_formula_impl(filepath, sheet_name, cell, formula)
+    if isinstance(validation, dict) and "error" in validation:
+        return f"Error: {validation['error']}"
+
+    # If valid, apply the formula
+    result = apply_formula_impl(filepath, sheet_name, cell, formula)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, CalculationError)
 def validate_formula_syntax(
     filepath: str,
     sheet_name: str,
@@ -128,17 +211,11 @@ def validate_formula_syntax(
     formula: str,
 ) -> str:
     """Validate Excel formula syntax without applying it."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = validate_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating formula: {e}")
-        raise
+    result = validate_formula_impl(filepath, sheet_name, cell, formula)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, FormattingError)
 def format_range(
     filepath: str,
     sheet_name: str,
@@ -160,39 +237,31 @@ def format_range(
     conditional_format: Optional[Dict[str, Any]] = None
 ) -> str:
     """Apply formatting to a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.formatting import format_range as format_range_func
-        
-        # Convert None values to appropriate defaults for the underlying function
-        format_range_func(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            start_cell=start_cell,
-            end_cell=end_cell,  # This can be None
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            font_size=font_size,  # This can be None
-            font_color=font_color,  # This can be None
-            bg_color=bg_color,  # This can be None
-            border_style=border_style,  # This can be None
-            border_color=border_color,  # This can be None
-            number_format=number_format,  # This can be None
-            alignment=alignment,  # This can be None
-            wrap_text=wrap_text,
-            merge_cells=merge_cells,
-            protection=protection,  # This can be None
-            conditional_format=conditional_format  # This can be None
-        )
-        return "Range formatted successfully"
-    except (ValidationError, FormattingError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error formatting range: {e}")
-        raise
+    # Convert None values to appropriate defaults for the underlying function
+    format_range_func(
+        filepath=filepath,
+        sheet_name=sheet_name,
+        start_cell=start_cell,
+        end_cell=end_cell,  # This can be None
+        bold=bold,
+        italic=italic,
+        underline=underline,
+        font_size=font_size,  # This can be None
+        font_color=font_color,  # This can be None
+        bg_color=bg_color,  # This can be None
+        border_style=border_style,  # This can be None
+        border_color=border_color,  # This can be None
+        number_format=number_format,  # This can be None
+        alignment=alignment,  # This can be None
+        wrap_text=wrap_text,
+        merge_cells=merge_cells,
+        protection=protection,  # This can be None
+        conditional_format=conditional_format  # This can be None
+    )
+    return "Range formatted successfully"
 
 @mcp.tool()
+@excel_tool()
 def read_data_from_excel(
     filepath: str,
     sheet_name: str,
@@ -214,27 +283,22 @@ def read_data_from_excel(
     JSON string containing structured cell data with validation metadata.
     Each cell includes: address, value, row, column, and validation info (if any).
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.data import read_excel_range_with_metadata
-        result = read_excel_range_with_metadata(
-            full_path, 
-            sheet_name, 
-            start_cell, 
-            end_cell
-        )
-        if not result or not result.get("cells"):
-            return "No data found in specified range"
-            
-        # Return as formatted JSON string
-        import json
-        return json.dumps(result, indent=2, default=str)
-        
-    except Exception as e:
-        logger.error(f"Error reading data: {e}")
-        raise
+    result = read_excel_range_with_metadata(
+        filepath, 
+        sheet_name, 
+        start_cell, 
+        end_cell,
+        preview_only=preview_only
+    )
+    if not result or not result.get("cells"):
+        return "No data found in specified range"
+
+    # Return as compact JSON string; json only uses its C encoder
+    # when no indent is requested
+    return json.dumps(result, default=str, separators=(",", ":"))
 
 @mcp.tool()
+@excel_tool(ValidationError, DataError)
 def write_data_to_excel(
     filepath: str,
     sheet_name: str,
@@ -252,45 +316,25 @@ def write_data_to_excel(
     start_cell: Cell to start writing to, default is "A1"
   
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = write_data(full_path, sheet_name, data, start_cell)
-        return result["message"]
-    except (ValidationError, DataError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error writing data: {e}")
-        raise
+    result = write_data(filepath, sheet_name, data, start_cell)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(WorkbookError)
 def create_workbook(filepath: str) -> str:
     """Create new Excel workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_workbook as create_workbook_impl
-        create_workbook_impl(full_path)
-        return f"Created workbook at {full_path}"
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating workbook: {e}")
-        raise
+    create_workbook_impl(filepath)
+    return f"Created workbook at {filepath}"
 
 @mcp.tool()
+@excel_tool(ValidationError, WorkbookError)
 def create_worksheet(filepath: str, sheet_name: str) -> str:
     """Create new worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_sheet as create_worksheet_impl
-        result = create_worksheet_impl(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, WorkbookError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating worksheet: {e}")
-        raise
+    result = create_worksheet_impl(filepath, sheet_name)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, ChartError)
 def create_chart(
     filepath: str,
     sheet_name: str,
@@ -302,26 +346,20 @@ def create_chart(
     y_axis: str = ""
 ) -> str:
     """Create chart in worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_chart_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            chart_type=chart_type,
-            target_cell=target_cell,
-            title=title,
-            x_axis=x_axis,
-            y_axis=y_axis
-        )
-        return result["message"]
-    except (ValidationError, ChartError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating chart: {e}")
-        raise
+    result = create_chart_impl(
+        filepath=filepath,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        chart_type=chart_type,
+        target_cell=target_cell,
+        title=title,
+        x_axis=x_axis,
+        y_axis=y_axis
+    )
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, PivotError)
 def create_pivot_table(
     filepath: str,
     sheet_name: str,
@@ -332,25 +370,19 @@ def create_pivot_table(
     agg_func: str = "mean"
 ) -> str:
     """Create pivot table in worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_pivot_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            rows=rows,
-            values=values,
-            columns=columns or [],
-            agg_func=agg_func
-        )
-        return result["message"]
-    except (ValidationError, PivotError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating pivot table: {e}")
-        raise
+    result = create_pivot_table_impl(
+        filepath=filepath,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        rows=rows,
+        values=values,
+        columns=columns or [],
+        agg_func=agg_func
+    )
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(DataError)
 def create_table(
     filepath: str,
     sheet_name: str,
@@ -359,127 +391,78 @@ def create_table(
     table_style: str = "TableStyleMedium9"
 ) -> str:
     """Creates a native Excel table from a specified range of data."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            table_name=table_name,
-            table_style=table_style
-        )
-        return result["message"]
-    except DataError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating table: {e}")
-        raise
+    result = create_table_impl(
+        filepath=filepath,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        table_name=table_name,
+        table_style=table_style
+    )
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def copy_worksheet(
     filepath: str,
     source_sheet: str,
     target_sheet: str
 ) -> str:
     """Copy worksheet within workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = copy_sheet(full_path, source_sheet, target_sheet)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying worksheet: {e}")
-        raise
+    result = copy_sheet(filepath, source_sheet, target_sheet)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def delete_worksheet(
     filepath: str,
     sheet_name: str
 ) -> str:
     """Delete worksheet from workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_sheet(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting worksheet: {e}")
-        raise
+    result = delete_sheet(filepath, sheet_name)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def rename_worksheet(
     filepath: str,
     old_name: str,
     new_name: str
 ) -> str:
     """Rename worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = rename_sheet(full_path, old_name, new_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error renaming worksheet: {e}")
-        raise
+    result = rename_sheet(filepath, old_name, new_name)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(WorkbookError)
 def get_workbook_metadata(
     filepath: str,
     include_ranges: bool = False
 ) -> str:
     """Get metadata about workbook including sheets, ranges, etc."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = get_workbook_info(full_path, include_ranges=include_ranges)
-        return str(result)
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error getting workbook metadata: {e}")
-        raise
+    return _get_cached_workbook_metadata(filepath, include_ranges)
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Merge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = merge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error merging cells: {e}")
-        raise
+    result = merge_range(filepath, sheet_name, start_cell, end_cell)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def unmerge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Unmerge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error unmerging cells: {e}")
-        raise
+    result = unmerge_range(filepath, sheet_name, start_cell, end_cell)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def get_merged_cells(filepath: str, sheet_name: str) -> str:
     """Get merged cells in a worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        return str(get_merged_ranges(full_path, sheet_name))
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error getting merged cells: {e}")
-        raise
+    return str(get_merged_ranges(filepath, sheet_name))
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def copy_range(
     filepath: str,
     sheet_name: str,
@@ -489,25 +472,18 @@ def copy_range(
     target_sheet: Optional[str] = None
 ) -> str:
     """Copy a range of cells to another location."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import copy_range_operation
-        result = copy_range_operation(
-            full_path,
-            sheet_name,
-            source_start,
-            source_end,
-            target_start,
-            target_sheet or sheet_name  # Use source sheet if target_sheet is None
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying range: {e}")
-        raise
+    result = copy_range_operation(
+        filepath,
+        sheet_name,
+        source_start,
+        source_end,
+        target_start,
+        target_sheet or sheet_name  # Use source sheet if target_sheet is None
+    )
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def delete_range(
     filepath: str,
     sheet_name: str,
@@ -516,24 +492,17 @@ def delete_range(
     shift_direction: str = "up"
 ) -> str:
     """Delete a range of cells and shift remaining cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import delete_range_operation
-        result = delete_range_operation(
-            full_path,
-            sheet_name,
-            start_cell,
-            end_cell,
-            shift_direction
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting range: {e}")
-        raise
+    result = delete_range_operation(
+        filepath,
+        sheet_name,
+        start_cell,
+        end_cell,
+        shift_direction
+    )
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError)
 def validate_excel_range(
     filepath: str,
     sheet_name: str,
@@ -541,18 +510,12 @@ def validate_excel_range(
     end_cell: Optional[str] = None
 ) -> str:
     """Validate if a range exists and is properly formatted."""
-    try:
-        full_path = get_excel_path(filepath)
-        range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
-        result = validate_range_impl(full_path, sheet_name, range_str)
-        return result["message"]
-    except ValidationError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating range: {e}")
-        raise
+    range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
+    result = validate_range_impl(filepath, sheet_name, range_str)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool()
 def get_data_validation_info(
     filepath: str,
     sheet_name: str
@@ -570,33 +533,24 @@ def get_data_validation_info(
     Returns:
         JSON string containing all validation rules in the worksheet
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from openpyxl import load_workbook
-        from excel_mcp.cell_validation import get_all_validation_ranges
-        
-        wb = load_workbook(full_path, read_only=False)
-        if sheet_name not in wb.sheetnames:
-            return f"Error: Sheet '{sheet_name}' not found"
-            
-        ws = wb[sheet_name]
-        validations = get_all_validation_ranges(ws)
-        wb.close()
-        
-        if not validations:
-            return "No data validation rules found in this worksheet"
-            
-        import json
-        return json.dumps({
-            "sheet_name": sheet_name,
-            "validation_rules": validations
-        }, indent=2, default=str)
-        
-    except Exception as e:
-        logger.error(f"Error getting validation info: {e}")
-        raise
+    wb = load_workbook(filepath, read_only=False)
+    if sheet_name not in wb.sheetnames:
+        return f"Error: Sheet '{sheet_name}' not found"
+
+    ws = wb[sheet_name]
+    validations = get_all_validation_ranges(ws)
+    wb.close()
+
+    if not validations:
+        return "No data validation rules found in this worksheet"
+
+    return json.dumps({
+        "sheet_name": sheet_name,
+        "validation_rules": validations
+    }, indent=2, default=str)
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def insert_rows(
     filepath: str,
     sheet_name: str,
@@ -604,17 +558,11 @@ def insert_rows(
     count: int = 1
 ) -> str:
     """Insert one or more rows starting at the specified row."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = insert_row(full_path, sheet_name, start_row, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error inserting rows: {e}")
-        raise
+    result = insert_row(filepath, sheet_name, start_row, count)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def insert_columns(
     filepath: str,
     sheet_name: str,
@@ -622,17 +570,11 @@ def insert_columns(
     count: int = 1
 ) -> str:
     """Insert one or more columns starting at the specified column."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = insert_cols(full_path, sheet_name, start_col, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error inserting columns: {e}")
-        raise
+    result = insert_cols(filepath, sheet_name, start_col, count)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def delete_sheet_rows(
     filepath: str,
     sheet_name: str,
@@ -640,17 +582,11 @@ def delete_sheet_rows(
     count: int = 1
 ) -> str:
     """Delete one or more rows starting at the specified row."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_rows(full_path, sheet_name, start_row, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting rows: {e}")
-        raise
+    result = delete_rows(filepath, sheet_name, start_row, count)
+    return result["message"]
 
 @mcp.tool()
+@excel_tool(ValidationError, SheetError)
 def delete_sheet_columns(
     filepath: str,
     sheet_name: str,
@@ -658,31 +594,26 @@ def delete_sheet_columns(
     count: int = 1
 ) -> str:
     """Delete one or more columns starting at the specified column."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_cols(full_path, sheet_name, start_col, count)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting columns: {e}")
-        raise
+    result = delete_cols(filepath, sheet_name, start_col, count)
+    return result["message"]
 
 def run_sse():
     """Run Excel MCP server in SSE mode."""
     # Assign value to EXCEL_FILES_PATH in SSE mode
     global EXCEL_FILES_PATH
     EXCEL_FILES_PATH = os.environ.get("EXCEL_FILES_PATH", "./excel_files")
+    # Resolved paths depend on EXCEL_FILES_PATH
+    get_excel_path.cache_clear()
     # Create directory if it doesn't exist
     os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
     
     try:
-        logger.info(f"Starting Excel MCP server with SSE transport (files directory: {EXCEL_FILES_PATH})")
+        logger.info("Starting Excel MCP server with SSE transport (files directory: %s)", EXCEL_FILES_PATH)
         mcp.run(transport="sse")
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed: {e}")
+        logger.error("Server failed: %s", e)
         raise
     finally:
         logger.info("Server shutdown complete")
@@ -692,16 +623,18 @@ def run_streamable_http():
     # Assign value to EXCEL_FILES_PATH in streamable HTTP mode
     global EXCEL_FILES_PATH
     EXCEL_FILES_PATH = os.environ.get("EXCEL_FILES_PATH", "./excel_files")
+    # Resolved paths depend on EXCEL_FILES_PATH
+    get_excel_path.cache_clear()
     # Create directory if it doesn't exist
     os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
     
     try:
-        logger.info(f"Starting Excel MCP server with streamable HTTP transport (files directory: {EXCEL_FILES_PATH})")
+        logger.info("Starting Excel MCP server with streamable HTTP transport (files directory: %s)", EXCEL_FILES_PATH)
         mcp.run(transport="streamable-http")
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed: {e}")
+        logger.error("Server failed: %s", e)
         raise
     finally:
         logger.info("Server shutdown complete")
@@ -716,7 +649,7 @@ def run_stdio():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed: {e}")
+        logger.error("Server failed: %s", e)
         raise
     finally:
         logger.info("Server shutdown complete")
\ No newline at end of file
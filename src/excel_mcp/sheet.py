@@ -32,7 +32,7 @@ def copy_sheet(filepath: str, source_sheet: str, target_sheet: str) -> Dict[str,
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to copy sheet: {e}")
+        logger.error("Failed to copy sheet: %s", e)
         raise SheetError(str(e))
 
 def delete_sheet(filepath: str, sheet_name: str) -> Dict[str, Any]:
@@ -52,7 +52,7 @@ def delete_sheet(filepath: str, sheet_name: str) -> Dict[str, Any]:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to delete sheet: {e}")
+        logger.error("Failed to delete sheet: %s", e)
         raise SheetError(str(e))
 
 def rename_sheet(filepath: str, old_name: str, new_name: str) -> Dict[str, Any]:
@@ -73,7 +73,7 @@ def rename_sheet(filepath: str, old_name: str, new_name: str) -> Dict[str, Any]:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to rename sheet: {e}")
+        logger.error("Failed to rename sheet: %s", e)
         raise SheetError(str(e))
 
 def format_range_string(start_row: int, start_col: int, end_row: int, end_col: int) -> str:
@@ -207,7 +207,7 @@ def merge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str)
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to merge range: {e}")
+        logger.error("Failed to merge range: %s", e)
         raise SheetError(str(e))
 
 def unmerge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> Dict[str, Any]:
@@ -240,7 +240,7 @@ def unmerge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to unmerge range: {e}")
+        logger.error("Failed to unmerge range: %s", e)
         raise SheetError(str(e))
 
 def get_merged_ranges(filepath: str, sheet_name: str) -> list[str]:
@@ -255,7 +255,7 @@ def get_merged_ranges(filepath: str, sheet_name: str) -> list[str]:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to get merged cells: {e}")
+        logger.error("Failed to get merged cells: %s", e)
         raise SheetError(str(e))
 
 def copy_range_operation(
@@ -270,7 +270,7 @@ def copy_range_operation(
     try:
         wb = load_workbook(filepath)
         if sheet_name not in wb.sheetnames:
-            logger.error(f"Sheet '{sheet_name}' not found")
+            logger.error("Sheet '%s' not found", sheet_name)
             raise ValidationError(f"Sheet '{sheet_name}' not found")
 
         source_ws = wb[sheet_name]
@@ -280,7 +280,7 @@ def copy_range_operation(
         try:
             start_row, start_col, end_row, end_col = parse_cell_range(source_start, source_end)
         except ValueError as e:
-            logger.error(f"Invalid source range: {e}")
+            logger.error("Invalid source range: %s", e)
             raise ValidationError(f"Invalid source range: {str(e)}")
 
         # Parse target starting point
@@ -288,7 +288,7 @@ def copy_range_operation(
             target_row = int(''.join(filter(str.isdigit, target_start)))
             target_col = column_index_from_string(''.join(filter(str.isalpha, target_start)))
         except ValueError as e:
-            logger.error(f"Invalid target cell: {e}")
+            logger.error("Invalid target cell: %s", e)
             raise ValidationError(f"Invalid target cell: {str(e)}")
 
         # Copy the range
@@ -309,7 +309,7 @@ def copy_range_operation(
     except (ValidationError, SheetError):
         raise
     except Exception as e:
-        logger.error(f"Failed to copy range: {e}")
+        logger.error("Failed to copy range: %s", e)
         raise SheetError(f"Failed to copy range: {str(e)}")
 
 def delete_range_operation(
@@ -363,7 +363,7 @@ def delete_range_operation(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to delete range: {e}")
+        logger.error("Failed to delete range: %s", e)
         raise SheetError(str(e))
 
 def insert_row(filepath: str, sheet_name: str, start_row: int, count: int = 1) -> Dict[str, Any]:
@@ -389,7 +389,7 @@ def insert_row(filepath: str, sheet_name: str, start_row: int, count: int = 1) -
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to insert rows: {e}")
+        logger.error("Failed to insert rows: %s", e)
         raise SheetError(str(e))
 
 def insert_cols(filepath: str, sheet_name: str, start_col: int, count: int = 1) -> Dict[str, Any]:
@@ -415,7 +415,7 @@ def insert_cols(filepath: str, sheet_name: str, start_col: int, count: int = 1)
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to insert columns: {e}")
+        logger.error("Failed to insert columns: %s", e)
         raise SheetError(str(e))
 
 def delete_rows(filepath: str, sheet_name: str, start_row: int, count: int = 1) -> Dict[str, Any]:
@@ -443,7 +443,7 @@ def delete_rows(filepath: str, sheet_name: str, start_row: int, count: int = 1)
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to delete rows: {e}")
+        logger.error("Failed to delete rows: %s", e)
         raise SheetError(str(e))
 
 def delete_cols(filepath: str, sheet_name: str, start_col: int, count: int = 1) -> Dict[str, Any]:
@@ -471,5 +471,5 @@ def delete_cols(filepath: str, sheet_name: str, start_col: int, count: int = 1)
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to delete columns: {e}")
+        logger.error("Failed to delete columns: %s", e)
         raise SheetError(str(e))
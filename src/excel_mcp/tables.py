@@ -65,5 +65,5 @@ def create_excel_table(
         }
 
     except Exception as e:
-        logger.error(f"Failed to create table: {e}")
+        logger.error("Failed to create table: %s", e)
         raise DataError(str(e)) 
\ No newline at end of file
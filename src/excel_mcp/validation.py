@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 from typing import Any
@@ -11,6 +12,10 @@ from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+_FORMULA_REF_RE = re.compile(r'[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?')
+_FUNCTION_CALL_RE = re.compile(r"([A-Z]+)\(")
+_UNSAFE_FUNCTIONS = frozenset({"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"})
+
 def validate_formula_in_cell_operation(
     filepath: str,
     sheet_name: str,
@@ -32,7 +37,7 @@ def validate_formula_in_cell_operation(
             raise ValidationError(f"Invalid formula syntax: {message}")
 
         # Additional validation for cell references in formula
-        cell_refs = re.findall(r'[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?', formula)
+        cell_refs = _FORMULA_REF_RE.findall(formula)
         for ref in cell_refs:
             if ':' in ref:  # Range reference
                 start, end = ref.split(':')
@@ -91,7 +96,7 @@ def validate_formula_in_cell_operation(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to validate formula: {e}")
+        logger.error("Failed to validate formula: %s", e)
         raise ValidationError(str(e))
 
 def validate_range_in_sheet_operation(
@@ -159,9 +164,11 @@ def validate_range_in_sheet_operation(
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to validate range: {e}")
+        logger.error("Failed to validate range: %s", e)
         raise ValidationError(str(e))
 
+# The result depends only on the formula text, so repeated formulas are cached
+@functools.lru_cache(maxsize=256)
 def validate_formula(formula: str) -> tuple[bool, str]:
     """Validate Excel formula syntax and safety"""
     if not formula.startswith("="):
@@ -184,12 +191,10 @@ def validate_formula(formula: str) -> tuple[bool, str]:
         return False, "Unclosed parenthesis"
 
     # Basic function name validation
-    func_pattern = r"([A-Z]+)\("
-    funcs = re.findall(func_pattern, formula)
-    unsafe_funcs = {"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"}
+    funcs = _FUNCTION_CALL_RE.findall(formula)
 
     for func in funcs:
-        if func in unsafe_funcs:
+        if func in _UNSAFE_FUNCTIONS:
             return False, f"Unsafe function: {func}"
 
     return True, "Formula is valid"
@@ -5,6 +5,7 @@ from typing import Any
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 
+from .cell_utils import get_sheet_bounds
 from .exceptions import WorkbookError
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ def create_workbook(filepath: str, sheet_name: str = "Sheet1") -> dict[str, Any]
             "workbook": wb
         }
     except Exception as e:
-        logger.error(f"Failed to create workbook: {e}")
+        logger.error("Failed to create workbook: %s", e)
         raise WorkbookError(f"Failed to create workbook: {e!s}")
 
 def get_or_create_workbook(filepath: str) -> Workbook:
@@ -57,17 +58,20 @@ def create_sheet(filepath: str, sheet_name: str) -> dict:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to create sheet: {e}")
+        logger.error("Failed to create sheet: %s", e)
         raise WorkbookError(str(e))
 
 def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str, Any]:
     """Get metadata about workbook including sheets, ranges, etc."""
+    wb = None
     try:
         path = Path(filepath)
         if not path.exists():
             raise WorkbookError(f"File not found: {filepath}")
             
-        wb = load_workbook(filepath, read_only=False)
+        # Only sheet names and dimensions are needed, which read-only mode
+        # provides without parsing any cells
+        wb = load_workbook(filepath, read_only=True)
         
         info = {
             "filename": path.name,
@@ -81,16 +85,19 @@ def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str,
             ranges = {}
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
-                if ws.max_row > 0 and ws.max_column > 0:
-                    ranges[sheet_name] = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
+                _, _, max_row, max_col = get_sheet_bounds(ws)
+                if max_row > 0 and max_col > 0:
+                    ranges[sheet_name] = f"A1:{get_column_letter(max_col)}{max_row}"
             info["used_ranges"] = ranges
             
-        wb.close()
         return info
         
     except WorkbookError as e:
         logger.error(str(e))
         raise
     except Exception as e:
-        logger.error(f"Failed to get workbook info: {e}")
+        logger.error("Failed to get workbook info: %s", e)
         raise WorkbookError(str(e))
+    finally:
+        if wb is not None:
+            wb.close()